@@ -1,4 +1,3 @@
-import copy
 import os
 from typing import Any
 
@@ -99,8 +98,9 @@ def _to_toml_dict(program_input: ProgramInput, struct_filename: str) -> dict[str
 
     This function makes it easier to test for the correct TOML structure.
     """
-    # Start with existing keywords
-    toml_dict = copy.deepcopy(program_input.keywords)
+    # Start with existing keywords. Only the top level and calculation.level
+    # entries are modified below, so copy just those instead of deep copying.
+    toml_dict = dict(program_input.keywords)
 
     # Top level keywords
     # Logical cores was 10% faster than physical cores, so not using psutil
@@ -123,8 +123,8 @@ def _to_toml_dict(program_input: ProgramInput, struct_filename: str) -> dict[str
             )
 
     # Calculation level keywords
-    calculation = toml_dict.pop("calculation", {})
-    calculation_level = calculation.pop("level", [])
+    calculation = dict(toml_dict.pop("calculation", {}))
+    calculation_level = [dict(level) for level in calculation.pop("level", [])]
     if len(calculation_level) == 0:
         calculation_level.append({})
     for level_dict in calculation_level:
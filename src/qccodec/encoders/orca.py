@@ -15,20 +15,21 @@ SUPPORTED_CALCTYPES = {
 }
 XYZ_FILENAME = "geometry.xyz"
 PADDING = 20  # padding between keyword and value
+_BLOCK_KEYWORD_FMT = f"    {{:<{PADDING}}} {{}}"  # '    key      value' in blocks
+
+_NON_BLOCKS = {  # disallowed top-level blocks → where to set instead
+    "coords": ".structure",
+}
+_NON_BLOCK_KEYWORDS = {  # disallowed keys inside allowed blocks → where to set instead
+    "method": {"method": ".model.method", "runtyp": ".calctype"},
+    "basis": {"basis": ".model.basis"},
+}
+_KEYWORDS_NEEDING_QUOTES = frozenset({"auxc", "auxj", "auxjk"})
 
 
 def _validate_keywords(keywords: dict[str, Any]) -> None:
     """Validate keywords for ORCA encoder. Expecting all lowercase keys."""
 
-    _NON_BLOCKS = {  # disallowed top-level blocks → where to set instead
-        "coords": ".structure",
-    }
-
-    _NON_BLOCK_KEYWORDS = {  # disallowed keys inside allowed blocks → where to set instead
-        "method": {"method": ".model.method", "runtyp": ".calctype"},
-        "basis": {"basis": ".model.basis"},
-    }
-
     # 1) Blocks that should not appear as top-level keywords
     for block, where in _NON_BLOCKS.items():
         if block in keywords:
@@ -49,8 +50,7 @@ def _validate_keywords(keywords: dict[str, Any]) -> None:
 
 def _fmt(key: str, value: Any) -> Any:
     """Format a value for ORCA input."""
-    keywords_needing_quotes = {"auxc", "auxj", "auxjk"}
-    if key.casefold() in keywords_needing_quotes:
+    if key.casefold() in _KEYWORDS_NEEDING_QUOTES:
         return f'"{value}"'  # ORCA needs quotes for certain keywords
     if isinstance(value, bool):
         return str(value).lower()  # ORCA expects 'true'/'false' for booleans
@@ -71,9 +71,10 @@ def encode(program_input: ProgramInput) -> NativeInput:
             casing of keywords as provided in program_input.keywords.
         - ORCA requires passing `numgrad` for numerical gradients. To activate a
             numerical gradient for a single point or optimization pass
-            `{"numgrad": "true"} in the keywords or `{"numgrad": {...}}` with a
-            dictionary of numgrad block keywords. An empty dictionary will also work
-            (equivalent to `{"numgrad": "true"}`).
+            `{"numgrad": True}` (or the string `"true"`) in the keywords or
+            `{"numgrad": {...}}` with a dictionary of numgrad block keywords. An
+            empty dictionary will also work (equivalent to `{"numgrad": True}`).
+            `False` or `"false"` leaves numerical gradients off.
     """
 
     # Handle ORCA's case-insensitive keywords by doing caseless lookups
@@ -98,9 +99,12 @@ def encode(program_input: ProgramInput) -> NativeInput:
     # Method and Basis
     inp_lines.append(f"! {program_input.model.method} {program_input.model.basis}")
 
-    # NumGrad. May be used for gradients or optimizations
-    if "numgrad" in kw_lower:
-        inp_lines.append(f"! numgrad")
+    # NumGrad. May be used for gradients or optimizations. An empty block counts.
+    numgrad = kw_lower.get("numgrad")
+    if isinstance(numgrad, str):  # ORCA spells booleans as 'true'/'false'
+        numgrad = numgrad.casefold() == "true"
+    if isinstance(numgrad, Mapping) or numgrad:
+        inp_lines.append("! numgrad")
 
     # Set ORCA runtyp based on calctype
     if program_input.calctype == CalcType.energy:
@@ -120,15 +124,17 @@ def encode(program_input: ProgramInput) -> NativeInput:
     inp_lines.append(f"! {runtyp}\n")
 
     # Input Blocks
+    has_blocks = False
     for block, kwargs in kw_lower.items():
         if isinstance(kwargs, Mapping):  # Skip non-block keywords
+            has_blocks = True
             inp_lines.append(f"%{block}")
             for key, value in kwargs.items():
-                inp_lines.append(f"    {key:<{PADDING}} {_fmt(key, value)}")
+                inp_lines.append(_BLOCK_KEYWORD_FMT.format(key, _fmt(key, value)))
             inp_lines.append("end")
 
     # Write a new line if there were any blocks
-    if any(isinstance(v, Mapping) for v in kw_lower.values()):
+    if has_blocks:
         inp_lines.append("")
 
     # Structure
@@ -12,6 +12,7 @@ SUPPORTED_CALCTYPES = {
 }
 XYZ_FILENAME = "geometry.xyz"
 PADDING = 20  # padding between keyword and value in tc.in
+_KEYWORD_FMT = f"{{:<{PADDING}}} {{}}"  # 'key      value' lines of tc.in
 
 
 def encode(program_input: ProgramInput) -> NativeInput:
@@ -41,14 +42,16 @@ def encode(program_input: ProgramInput) -> NativeInput:
 
     # Collect lines for input file
     inp_lines = []
-    inp_lines.append(f"{'run':<{PADDING}} {calctype}")
+    inp_lines.append(_KEYWORD_FMT.format("run", calctype))
     # Structure
-    inp_lines.append(f"{'coordinates':<{PADDING}} {XYZ_FILENAME}")
-    inp_lines.append(f"{'charge':<{PADDING}} {program_input.structure.charge}")
-    inp_lines.append(f"{'spinmult':<{PADDING}} {program_input.structure.multiplicity}")
+    inp_lines.append(_KEYWORD_FMT.format("coordinates", XYZ_FILENAME))
+    inp_lines.append(_KEYWORD_FMT.format("charge", program_input.structure.charge))
+    inp_lines.append(
+        _KEYWORD_FMT.format("spinmult", program_input.structure.multiplicity)
+    )
     # Model
-    inp_lines.append(f"{'method':<{PADDING}} {program_input.model.method}")
-    inp_lines.append(f"{'basis':<{PADDING}} {program_input.model.basis}")
+    inp_lines.append(_KEYWORD_FMT.format("method", program_input.model.method))
+    inp_lines.append(_KEYWORD_FMT.format("basis", program_input.model.basis))
 
     # Keywords
     non_keywords = {
@@ -66,7 +69,7 @@ def encode(program_input: ProgramInput) -> NativeInput:
                 f"should be set at '{non_keywords[key]}'",
             )
         # Lowercase booleans
-        inp_lines.append(f"{key:<{PADDING}} {str(value).lower()}")
+        inp_lines.append(_KEYWORD_FMT.format(key, str(value).lower()))
     return NativeInput(
         input_file="\n".join(inp_lines) + "\n",  # End file with newline
         geometry_file=program_input.structure.to_xyz(),
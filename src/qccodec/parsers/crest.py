@@ -338,8 +338,9 @@ def parse_trajectory(
         float(struct.extras[Structure._xyz_comment_key][1]) for struct in structures
     ]
 
-    # Fake gradient for each step because CREST does not output it
-    fake_gradient = np.zeros(len(input_data.structure.symbols) * 3)
+    # Fake gradient for each step because CREST does not output it. Allocated once
+    # in the (natoms, 3) shape SinglePointData stores, so no per-step reshape.
+    fake_gradient = np.zeros((len(input_data.structure.symbols), 3))
 
     # Parse program version
     program_version = parse_version(stdout)
@@ -1,11 +1,11 @@
 """Parsers for Orca output files."""
 
-import itertools
 import re
 from enum import Enum
 from pathlib import Path
 from typing import Generator
 
+import numpy as np
 from qcdata import (
     CalcType,
     ProgramInput,
@@ -20,6 +20,36 @@ from qccodec.exceptions import MatchNotFoundError, ParserError
 from ..registry import register
 from .utils import re_search
 
+_RE_FINAL_ENERGY = re.compile(r"FINAL SINGLE POINT ENERGY\s+(-?\d+\.\d+)")
+_RE_VERSION = re.compile(r"Program Version (\d+\.\d+\.\d+)")
+_RE_NATOMS = re.compile(r"Number of atoms\s*\.\.\.\s*(\d+)")
+_RE_NAME = re.compile(r"NAME\s+=\s+(.*)")
+# Header, dashed underline, optional blank line, then group-1 = the
+# '  1   O   :  x  y  z' lines. Each piece is anchored to a single line; do not
+# reintroduce '.*?' with re.DOTALL here, as a header with no block after it would
+# then scan to the end of stdout for every match attempt.
+_RE_GRAD_BLOCK = re.compile(
+    r"CARTESIAN GRADIENT[^\n]*\n"  # header, e.g. 'CARTESIAN GRADIENT (NUMERICAL)'
+    r"-+[ \t]*\n"  # dashed underline
+    r"(?:[ \t]*\n)?"  # optional blank line
+    r"((?:[ \t]*\d+[ \t]+\S+[ \t]*:[^\n]+(?:\n|\Z))+)"
+)
+_RE_GRAD_LABEL = re.compile(r"^[ \t]*\d+[ \t]+\S+[ \t]*:", flags=re.MULTILINE)
+# group-1 = body of the '$hessian' entry, up to the next '$' entry or end of file.
+# '[^$]*' runs straight to the next '$' without backtracking; a lazy '.*?' with
+# re.DOTALL would retry a lookahead at every character of the body.
+_RE_HESS_ENTRY = re.compile(r"^\$hessian[ \t]*\n([^$]*)", flags=re.MULTILINE)
+_RE_INIT_STDOUT = re.compile(
+    r"^(.*?\*\*\*\*END\s+OF\s+INPUT\*\*\*\*\s*\n\s*=*)",
+    flags=re.MULTILINE | re.VERBOSE | re.DOTALL,
+)
+_RE_OPT_GRADIENT_STDOUT = re.compile(
+    r"GEOMETRY\s*OPTIMIZATION\s*CYCLE\s*\d+\s*\*\s*\n\s*\**\s*\n"  # header
+    r"(.*?)"  # body
+    r"-*\s*\n\s*ORCA\s+GEOMETRY\s+RELAXATION\s+STEP",
+    flags=re.DOTALL,
+)
+
 
 class OrcaFileType(str, Enum):
     """Orca filetypes.
@@ -85,8 +115,7 @@ def iter_files(
 )
 def parse_energy(contents: str) -> float:
     """Parse the final energy from Orca stdout."""
-    regex = r"FINAL SINGLE POINT ENERGY\s+(-?\d+\.\d+)"
-    return float(re_search(regex, contents).group(1))
+    return float(re_search(_RE_FINAL_ENERGY, contents).group(1))
 
 
 @register(
@@ -104,19 +133,13 @@ def parse_gradient(contents: str) -> list[list[float]]:
         MatchNotFoundError: If no gradient data is found.
     """
     # Extract the gradient block lines
-    header_regex = r"CARTESIAN GRADIENT.*?(?=\d)"  # non-greedy lookahead to first digit
-    header_match = re_search(header_regex, contents, flags=re.DOTALL)
-
-    block_start = header_match.end()
-    block_lines = itertools.takewhile(
-        lambda line: re.search(r"\d\s*$", line), contents[block_start:].splitlines()
-    )
+    block = re_search(_RE_GRAD_BLOCK, contents).group(1)
 
-    # Parse values from block lines
-    line_regex = r".*:\s*(-?\d+\.\d+)\s+(-?\d+\.\d+)\s+(-?\d+\.\d+)"
-    line_matches = [re_search(line_regex, line) for line in block_lines]
-    gradient = [list(map(float, match.groups())) for match in line_matches]
-    return gradient
+    # Strip the leading 'index element :' labels, leaving only x, y, z values
+    values = np.fromstring(_RE_GRAD_LABEL.sub("", block), sep=" ")
+    if not values.size or values.size % 3:
+        raise ParserError(f"Failed to parse gradient block: {block}")
+    return values.reshape(-1, 3).tolist()
 
 
 @register(
@@ -127,33 +150,50 @@ def parse_gradient(contents: str) -> list[list[float]]:
 def parse_hessian(contents: str) -> list[list[float]]:
     """Parse hessian from .hess file."""
     # Find hessian entry in basename.hess file
-    entry = next(
-        (block for block in contents.split("$") if block.startswith("hess")),
-        None,
-    )
-    if entry is None:
+    match = _RE_HESS_ENTRY.search(contents)
+    if match is None:
         raise ParserError("Failed to find hessian block in Hessian file.")
-
-    dim = int(entry.splitlines()[1])
-
-    # Split the hessian entry into blocks on lines of the form '  0  1  2  3 ...'
-    split_result = re.split(r"^\s*(?:\d+\s+)+\d+\s*$", entry, flags=re.MULTILINE)
-    if not len(split_result) > 1:
+    entry = match.group(1)
+
+    # The dimension is the first line of the entry
+    dim_end = entry.index("\n")
+    dim = int(entry[:dim_end])
+
+    # Group rows into blocks started by lines of the form '  0  1  2  3 ...'.
+    # Column index lines have no decimal point; every data row does.
+    blocks: list[list[str]] = []
+    for line in entry[dim_end + 1 :].splitlines():
+        stripped = line.lstrip()
+        if not stripped:
+            continue
+        if stripped[0].isdigit() and "." not in stripped:
+            blocks.append([])
+        elif blocks:
+            blocks[-1].append(line)
+    if not blocks:
         raise ParserError(f"Failed to parse blocks in hessian entry: {entry}")
 
-    # Get the text for each block and
-    blocks = [block.strip() for block in split_result[1:]]
-    hessian: list[list[float]] = [[] for _ in range(dim)]
-    for block in blocks:
-        lines = block.splitlines()
-        if not len(lines) == dim:
-            raise ParserError(f"Block line count {len(lines)} does not match dimension {dim}: {block}")
-
-        for i, line in enumerate(block.splitlines()):
-            row = list(map(float, line.split()[1:]))
-            hessian[i].extend(row)
-
-    return hessian
+    hessian = np.empty((dim, dim))
+    col = 0
+    for rows in blocks:
+        if not len(rows) == dim:
+            raise ParserError(
+                f"Block line count {len(rows)} does not match dimension {dim}: {rows}"
+            )
+        values = np.fromstring("\n".join(rows), sep=" ")
+        if values.size % dim:
+            raise ParserError(f"Block rows have unequal lengths: {rows}")
+        # Drop the leading row index column
+        block = values.reshape(dim, -1)[:, 1:]
+        width = block.shape[1]
+        if col + width > dim:
+            raise ParserError(f"Hessian entry has more than {dim} columns: {entry}")
+        hessian[:, col : col + width] = block
+        col += width
+
+    if col != dim:
+        raise ParserError(f"Hessian entry has {col} columns, expected {dim}: {entry}")
+    return hessian.tolist()
 
 
 @register(
@@ -184,23 +224,18 @@ def parse_trajectory(
 
     # Parse the structures, energies, and gradients
     structures = Structure.open_multi(file)
+    # ORCA places the energy as the last value in the comment line
+    energies = [
+        float(struct.extras[Structure._xyz_comment_key][-1]) for struct in structures
+    ]
 
     # Capture initialization stdout
-    regex = r"^(.*?\*\*\*\*END\s+OF\s+INPUT\*\*\*\*\s*\n\s*=*)"
-    match = re_search(regex, stdout, flags=re.MULTILINE | re.VERBOSE | re.DOTALL)
-    if not match:
-        raise MatchNotFoundError(regex, stdout)
-    initialization_stdout = match.group(1)
+    initialization_stdout = re_search(_RE_INIT_STDOUT, stdout).group(1)
 
     # Capture the stdout for each gradient calculation
-    regex = (
-        r"GEOMETRY\s*OPTIMIZATION\s*CYCLE\s*\d+\s*\*\s*\n\s*\**\s*\n"  # header
-        r"(.*?)"  # body
-        r"-*\s*\n\s*ORCA\s+GEOMETRY\s+RELAXATION\s+STEP"
-    )
-    per_gradient_stdout = re.findall(regex, stdout, flags=re.DOTALL)
+    per_gradient_stdout = _RE_OPT_GRADIENT_STDOUT.findall(stdout)
     if not per_gradient_stdout:
-        raise MatchNotFoundError(regex, stdout)
+        raise MatchNotFoundError(_RE_OPT_GRADIENT_STDOUT.pattern, stdout)
 
     # Parse the gradient values from the stdout file
     from qccodec import decode
@@ -208,7 +243,9 @@ def parse_trajectory(
     # Create the trajectory
     trajectory: list[ProgramOutput] = []
 
-    for structure, grad_stdout in zip(structures, per_gradient_stdout):
+    for structure, energy, grad_stdout in zip(
+        structures, energies, per_gradient_stdout
+    ):
         # Create input data object for each structure and gradient in the trajectory.
         input_data_obj = ProgramInput(
             calctype=CalcType.gradient,
@@ -222,7 +259,7 @@ def parse_trajectory(
         assert isinstance(parsed_results, SinglePointData)  # for mypy
 
         spr_data = parsed_results.model_dump()
-        spr_data["energy"] = structure.extras[Structure._xyz_comment_key][-1]
+        spr_data["energy"] = energy
         results_obj = SinglePointData(**spr_data)
         # Create the provenance object for each structure and gradient in the trajectory.
         prov = Provenance(
@@ -244,8 +281,7 @@ def parse_trajectory(
 @register(filetype=OrcaFileType.STDOUT, target=("extras", "program_version"))
 def parse_version(contents: str) -> str:
     """Parse version string from Orca stdout."""
-    regex = r"Program Version (\d+\.\d+\.\d+)"
-    match = re_search(regex, contents)
+    match = re_search(_RE_VERSION, contents)
     return match.group(1)
 
 
@@ -259,13 +295,11 @@ def parse_natoms(contents: str) -> int:
     Raises:
         MatchNotFoundError: If the regex does not match.
     """
-    regex = r"Number of atoms\s*...\s*(\d+)"
-    match = re_search(regex, contents)
+    match = re_search(_RE_NATOMS, contents)
     return int(match.group(1))
 
 
 def parse_basename(contents: str) -> str:
     """Parse the file basename from Orca stdout."""
-    regex = r"NAME\s+=\s+(.*)"
-    match = re_search(regex, contents)
+    match = re_search(_RE_NAME, contents)
     return Path(match.group(1)).stem
@@ -5,6 +5,7 @@ from collections.abc import Generator
 from enum import Enum
 from pathlib import Path
 
+import numpy as np
 from qcconst import constants
 from qcdata import (
     CalcType,
@@ -20,6 +21,62 @@ from qccodec.exceptions import MatchNotFoundError, ParserError
 from ..registry import register
 from .utils import re_finditer, re_search
 
+# Patterns are compiled once at import rather than on every parser call.
+_RE_ENERGY = re.compile(r"FINAL ENERGY: (-?\d+(?:\.\d+)?)")
+_RE_GRADIENT = re.compile(
+    r"(?<=dE\/dX\s{12}dE\/dY\s{12}dE\/dZ\n)"  # Just after the header line
+    r"[\d\.\-\s]"  # the gradient block itself
+    r"+(?=\n(?:--|-=|\Z))"  # top at -- (grad) or -= (opt) or end of file (when I manually split opt logs)
+)
+# Whole lines after the Hessian banner, stopping at the first line of another shape
+_RE_HESSIAN_BLOCK = re.compile(
+    r"\*\*\* Hessian Matrix[^\n]*\n"
+    r"((?:"
+    r"[ \t]*\d+(?:[ \t]+-?\d\.\d+e[+-]\d+)+[ \t]*\n"  # row index and values
+    r"|[ \t]*\d+(?:[ \t]+\d+)*[ \t]*\n"  # column indices
+    r"|[ \t]*-[- \t]*\n"  # dashed underline
+    r"|[ \t]*\n"  # blank line between chunks
+    r")*)"
+)
+# Column index line and its dashed underline that start each six-column chunk
+_RE_HESSIAN_CHUNK_HEADER = re.compile(
+    r"^[ \t]*(?:\d+[ \t]+)*\d+[ \t]*\n[ \t]*-[- \t]*$", flags=re.MULTILINE
+)
+_RE_NATOMS = re.compile(r"Total atoms:\s*(\d+)")
+_RE_NMO = re.compile(r"Total orbitals:\s*(\d+)")
+_RE_INIT_STDOUT = re.compile(
+    r"""^(.*?)                # group-1 = everything before the banner
+        (?=                       # look-ahead, do NOT consume banner
+            ^-{55}\s*\r?\n        # 55 dashes
+            0\ additional\ frames\ found\ in\ \S+\.xyz\s*\r?\n
+            -{55}                 # 55 dashes
+        )
+    """,
+    flags=re.MULTILINE | re.VERBOSE | re.DOTALL,
+)
+_RE_OPT_GRADIENT_STDOUT = re.compile(
+    r"-=#=-\s+\(We'll Be Right Back\)\s+-=#=-\n(.*?)-=#=-\s+Now Returning to Optimizer\s+-=#=-",
+    flags=re.DOTALL,
+)
+_RE_VERSION_CONTROL = re.compile(r"(Git|Hg) Version: (\S*)")
+_RE_TERACHEM_VERSION = re.compile(r"TeraChem (v\S*)")
+_RE_JOB_FINISHED = re.compile(r"Job finished:")
+# Group names are CalcType values so a single scan identifies the calctype
+_RE_CALCTYPE = re.compile(
+    r"(?P<energy>SINGLE POINT ENERGY CALCULATIONS)"
+    r"|(?P<gradient>SINGLE POINT GRADIENT CALCULATIONS)"
+    r"|(?P<hessian>FREQUENCY ANALYSIS)"
+)
+_RE_EXCITED_STATE = re.compile(
+    r"^\s*(?:\d+)\s+(?P<energy>-?\d+\.\d+)\s+"
+    r"(?P<exc_energy>-?\d+\.\d+)\s+"
+    r"(?P<osc_strength>-?\d+\.\d+)\s+"
+    r"(?P<s_squared>-?\d+\.\d+)\s+"
+    r"(?P<max_ci_coeff>-?\d+\.\d+)\s+"
+    r"(?P<excitation>\d+\s+->\s+\d+\s+:\s+\w+\s+->\s+\w+)$",
+    flags=re.MULTILINE,
+)
+
 
 class TeraChemFileType(str, Enum):
     """TeraChem filetypes."""
@@ -71,8 +128,7 @@ def parse_energy(contents: str) -> float:
         - Works on frequency files containing many energy values because re.search()
           returns the first result.
     """
-    regex = r"FINAL ENERGY: (-?\d+(?:\.\d+)?)"
-    return float(re_search(regex, contents).group(1))
+    return float(re_search(_RE_ENERGY, contents).group(1))
 
 
 @register(
@@ -88,22 +144,18 @@ def parse_gradient(contents: str) -> list[list[float]]:
 
     Raises:
         MatchNotFoundError: If no gradient data is found.
+        ParserError: If the gradient block does not hold rows of (x, y, z) values.
 
     Notes:
         - This works for exciting state gradients as well because TeraChem prints out
             the targeted gradient as the "regular" gradient.
     """
-    regex = (
-        r"(?<=dE\/dX\s{12}dE\/dY\s{12}dE\/dZ\n)"  # Just after the header line
-        r"[\d\.\-\s]"  # the gradient block itself
-        r"+(?=\n(?:--|-=|\Z))"  # top at -- (grad) or -= (opt) or end of file (when I manually split opt logs)
-    )
-    match = re_search(regex, contents)
-    # Convert the found numbers to floats.
-    values = [float(val) for val in match.group(0).split()]
-    # Group the values into chunks of 3 (for x, y, z).
-    gradient = [values[i : i + 3] for i in range(0, len(values), 3)]
-    return gradient
+    block = re_search(_RE_GRADIENT, contents).group(0)
+    # Convert the found numbers to floats and group into rows of (x, y, z).
+    values = np.fromstring(block, sep=" ")
+    if not values.size or values.size % 3:
+        raise ParserError(f"Failed to parse gradient block: {block}")
+    return values.reshape(-1, 3).tolist()
 
 
 @register(
@@ -112,6 +164,9 @@ def parse_gradient(contents: str) -> list[list[float]]:
 def parse_hessian(contents: str) -> list[list[float]]:
     """Parse Hessian Matrix from TeraChem stdout in one pass.
 
+    TeraChem prints the Hessian in chunks of (up to) six columns. Each chunk row
+    starts with its row index followed by that row's values for the chunk's columns.
+
     Args:
         contents: The contents of the TeraChem stdout file.
 
@@ -122,29 +177,37 @@ def parse_hessian(contents: str) -> list[list[float]]:
         MatchNotFoundError: If no Hessian data is found.
         ParserError: If the extracted numbers cannot form a proper square matrix.
     """
-    regex = r"\s+(?P<atom_number>\d+)\s(?P<vals>(?:\s-?\d.\d{15}e[+-]\d{2})+)"
-    hessian: list[list[float]] = []
-
-    matches = re_finditer(regex, contents)
-    # Iterate over all matches and populate the Hessian matrix
-    for match in matches:
-        atom_index = int(match.group("atom_number")) - 1  # Convert to zero-based index
-        # Check if the Hessian matrix has enough rows
-        if len(hessian) <= atom_index:
-            # Add empty rows if necessary
-            hessian.extend([[] for _ in range(atom_index - len(hessian) + 1)])
-        # Extract the values and convert them to floats
-        vals = [float(val) for val in match.group("vals").split()]
-        # Add values to the corresponding row
-        hessian[atom_index].extend(vals)
-
-    # Verify that the Hessian is a square matrix.
-    for i, row in enumerate(hessian):
-        if len(row) != len(hessian):
+    block = re_search(_RE_HESSIAN_BLOCK, contents).group(1)
+    chunks = [chunk for chunk in _RE_HESSIAN_CHUNK_HEADER.split(block) if chunk.strip()]
+    if not chunks:
+        raise MatchNotFoundError(_RE_HESSIAN_BLOCK.pattern, contents)
+
+    # Every chunk holds all rows, so the first chunk gives the dimension.
+    dim = chunks[0].strip().count("\n") + 1
+    hessian = np.empty((dim, dim))
+    col = 0
+    for chunk in chunks:
+        values = np.fromstring(chunk, sep=" ")
+        if values.size % dim:
+            raise ParserError(
+                f"Hessian chunk has {values.size} values for {dim} rows: {chunk}"
+            )
+        # Drop the leading row index column
+        columns = values.reshape(dim, -1)[:, 1:]
+        width = columns.shape[1]
+        if col + width > dim:
             raise ParserError(
-                f"Hessian matrix is not square: row {i} has {len(row)} elements, expected {len(hessian)}."
+                f"Hessian matrix is not square: more than {dim} columns found."
             )
-    return hessian
+        hessian[:, col : col + width] = columns
+        col += width
+
+    # Verify that the Hessian is a square matrix.
+    if col != dim:
+        raise ParserError(
+            f"Hessian matrix is not square: found {col} columns, expected {dim}."
+        )
+    return hessian.tolist()
 
 
 @register(filetype=TeraChemFileType.STDOUT, target=("extras", "program_version"))
@@ -169,8 +232,7 @@ def parse_natoms(contents: str) -> int:
     Raises:
         MatchNotFoundError: If the regex does not match.
     """
-    regex = r"Total atoms:\s*(\d+)"
-    match = re_search(regex, contents)
+    match = re_search(_RE_NATOMS, contents)
     return int(match.group(1))
 
 
@@ -184,8 +246,7 @@ def parse_nmo(contents: str) -> int:
     Raises:
         MatchNotFoundError: If the regex does not match.
     """
-    regex = r"Total orbitals:\s*(\d+)"
-    match = re_search(regex, contents)
+    match = re_search(_RE_NMO, contents)
     return int(match.group(1))
 
 
@@ -219,27 +280,12 @@ def parse_trajectory(
     )
 
     # Capture initialization stdout
-    regex = r"""^(.*?)                # group-1 = everything before the banner
-        (?=                       # look-ahead, do NOT consume banner
-            ^-{55}\s*\r?\n        # 55 dashes
-            0\ additional\ frames\ found\ in\ \S+\.xyz\s*\r?\n
-            -{55}                 # 55 dashes
-        )
-    """
-    match = re.search(
-        regex,
-        stdout,
-        flags=re.MULTILINE | re.VERBOSE | re.DOTALL,
-    )
-    if not match:
-        raise MatchNotFoundError(regex, stdout)
-    initialization_stdout = match.group(1)
+    initialization_stdout = re_search(_RE_INIT_STDOUT, stdout).group(1)
 
     # Capture the stdout for each gradient calculation
-    regex = r"-=#=-\s+\(We'll Be Right Back\)\s+-=#=-\n(.*?)-=#=-\s+Now Returning to Optimizer\s+-=#=-"
-    per_gradient_stdout = re.findall(regex, stdout, flags=re.DOTALL)
+    per_gradient_stdout = _RE_OPT_GRADIENT_STDOUT.findall(stdout)
     if not per_gradient_stdout:
-        raise MatchNotFoundError(regex, stdout)
+        raise MatchNotFoundError(_RE_OPT_GRADIENT_STDOUT.pattern, stdout)
 
     # Parse the gradient values from the stdout file
     from qccodec import decode
@@ -284,37 +330,31 @@ def parse_trajectory(
 
 def parse_version_control_details(contents: str) -> str:
     """Parse TeraChem git commit or Hg version from TeraChem stdout."""
-    regex = r"(Git|Hg) Version: (\S*)"
-    return re_search(regex, contents).group(2)
+    return re_search(_RE_VERSION_CONTROL, contents).group(2)
 
 
 def parse_terachem_version(contents: str) -> str:
     """Parse TeraChem version from TeraChem stdout."""
-    regex = r"TeraChem (v\S*)"
-    return re_search(regex, contents).group(1)
+    return re_search(_RE_TERACHEM_VERSION, contents).group(1)
 
 
 def calculation_succeeded(contents: str) -> bool:
     """Determine from TeraChem stdout if a calculation completed successfully."""
-    regex = r"Job finished:"
-    if re.search(regex, contents):
+    if _RE_JOB_FINISHED.search(contents):
         # If any match for a failure regex is found, the calculation failed
         return True
     return False
 
 
 def parse_calctype(contents: str) -> CalcType:
-    """Parse the calctype from TeraChem stdout."""
-    calctypes = {
-        r"SINGLE POINT ENERGY CALCULATIONS": CalcType.energy,
-        r"SINGLE POINT GRADIENT CALCULATIONS": CalcType.gradient,
-        r"FREQUENCY ANALYSIS": CalcType.hessian,
-    }
-    for regex, calctype in calctypes.items():
-        match = re.search(regex, contents)
-        if match:
-            return calctype
-    raise MatchNotFoundError(regex, contents)
+    """Parse the calctype from TeraChem stdout.
+
+    Notes:
+        The calctype banners are combined into one alternation so the stdout is
+        scanned once rather than once per calctype.
+    """
+    match = re_search(_RE_CALCTYPE, contents)
+    return CalcType(match.lastgroup)
 
 
 @register(
@@ -335,15 +375,7 @@ def parse_excited_states(contents: str) -> list[dict]:
     Notes:
         Converts the excitation energy from eV to Hartree.
     """
-    regex = (
-        r"^\s*(?:\d+)\s+(?P<energy>-?\d+\.\d+)\s+"
-        r"(?P<exc_energy>-?\d+\.\d+)\s+"
-        r"(?P<osc_strength>-?\d+\.\d+)\s+"
-        r"(?P<s_squared>-?\d+\.\d+)\s+"
-        r"(?P<max_ci_coeff>-?\d+\.\d+)\s+"
-        r"(?P<excitation>\d+\s+->\s+\d+\s+:\s+\w+\s+->\s+\w+)$"
-    )
-    matches = re_finditer(regex, contents, re.MULTILINE)
+    matches = re_finditer(_RE_EXCITED_STATE, contents)
 
     # Create a list of dictionaries for each excited state
     excited_states = []
@@ -6,27 +6,42 @@ from qccodec.exceptions import MatchNotFoundError
 logger = logging.getLogger(__name__)
 
 
-def re_search(regex: str, contents: str, flags: int = 0) -> re.Match:
+def re_search(regex: str | re.Pattern, contents: str, flags: int = 0) -> re.Match:
     """
     Search for a regex pattern in a string and return the first match.
 
+    Args:
+        regex: A pattern string or a precompiled pattern. Flags may only be passed
+            with a pattern string; a compiled pattern carries its own flags.
+
     Raises:
         MatchNotFoundError if no match is found.
     """
     match = re.search(regex, contents, flags)
     if not match:
-        raise MatchNotFoundError(regex, contents)
+        raise MatchNotFoundError(_pattern_str(regex), contents)
     return match
 
 
-def re_finditer(regex: str, contents: str, flags: int = 0) -> list[re.Match]:
+def re_finditer(
+    regex: str | re.Pattern, contents: str, flags: int = 0
+) -> list[re.Match]:
     """
     Search for a regex pattern in a string and return all match objects.
 
+    Args:
+        regex: A pattern string or a precompiled pattern. Flags may only be passed
+            with a pattern string; a compiled pattern carries its own flags.
+
     Raises:
         MatchNotFoundError if no matches are found.
     """
     matches = list(re.finditer(regex, contents, flags))
     if not matches:
-        raise MatchNotFoundError(regex, contents)
+        raise MatchNotFoundError(_pattern_str(regex), contents)
     return matches
+
+
+def _pattern_str(regex: str | re.Pattern) -> str:
+    """Return the source string of a regex for error reporting."""
+    return regex.pattern if isinstance(regex, re.Pattern) else regex
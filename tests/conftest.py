@@ -1,3 +1,4 @@
+import functools
 import inspect
 import shutil
 from collections.abc import Callable
@@ -11,10 +12,20 @@ from qcdata import CalcType, ProgramInput
 from qcdata.utils import water
 
 from qccodec.codec import decode
+from qccodec.encoders.terachem import PADDING, XYZ_FILENAME
 from qccodec.exceptions import MatchNotFoundError
 from qccodec.registry import ParserRegistry, registry
 
 
+@functools.cache
+def read_test_file(path: Path) -> str:
+    """Read a test data file once per session.
+
+    The contents are immutable strings, so sharing them across tests is safe.
+    """
+    return path.read_text()
+
+
 @pytest.fixture(scope="session")
 def test_data_dir():
     """Test data directory Path"""
@@ -26,31 +37,43 @@ def parser_registry():
     return ParserRegistry()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def terachem_file(test_data_dir):
-    """Return a function that reads a file from the 'terachem' subdirectory."""
+    """Return a function that reads a file from the 'terachem' subdirectory.
+
+    Each file is read once per session via read_test_file; output-file fixtures
+    should follow suit.
+    """
 
     def _read(filename: str) -> str:
-        return (test_data_dir / "terachem" / filename).read_text()
+        return read_test_file(test_data_dir / "terachem" / filename)
 
     return _read
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def crest_file(test_data_dir):
-    """Return a function that reads a file from the 'crest' subdirectory."""
+    """Return a function that reads a file from the 'crest' subdirectory.
+
+    Each file is read once per session via read_test_file.
+    """
 
     def _read(filename: str) -> str:
-        return (test_data_dir / "crest" / filename).read_text()
+        return read_test_file(test_data_dir / "crest" / filename)
 
     return _read
 
 
 @pytest.fixture(scope="session")
 def prog_input_factory():
-    """Create a function that returns a ProgramInput object with a specified calculation type."""
+    """Create a function that returns a ProgramInput object with a specified calculation type.
 
-    def create_input(calctype):
+    Each calctype's ProgramInput is validated once per session. Callers receive a
+    deep copy, so tests may mutate it (e.g., .keywords.update()) freely.
+    """
+
+    @functools.cache
+    def _prototype(calctype) -> ProgramInput:
         return ProgramInput(
             structure=water,
             calctype=calctype,
@@ -58,9 +81,35 @@ def prog_input_factory():
             model={"method": "hf", "basis": "sto-3g"},
         )
 
+    def create_input(calctype):
+        return _prototype(calctype).model_copy(deep=True)
+
     return create_input
 
 
+def expected_tcin(
+    prog_input: ProgramInput, keyword_lines: dict[str, str], run: str | None = None
+) -> str:
+    """Build the tc.in file the TeraChem encoder should write for a ProgramInput.
+
+    Args:
+        prog_input: The ProgramInput being encoded.
+        keyword_lines: The keyword values expected after the model lines, spelled
+            exactly as they should appear in tc.in.
+        run: The expected TeraChem 'run' value. Defaults to the calctype value.
+    """
+    values = {
+        "run": run or prog_input.calctype.value,
+        "coordinates": XYZ_FILENAME,
+        "charge": prog_input.structure.charge,
+        "spinmult": prog_input.structure.multiplicity,
+        "method": prog_input.model.method,
+        "basis": prog_input.model.basis,
+        **keyword_lines,
+    }
+    return "".join(f"{key:<{PADDING}} {value}\n" for key, value in values.items())
+
+
 @dataclass
 class ParserTestCase:
     """Test case for a parser function.
@@ -102,8 +151,8 @@ class ParserTestCase:
 def _load_stdout(directory, stdout):
     """Load the stdout for a TestCase."""
     if isinstance(stdout, Path):
-        # Contents is a Path, so we read the file directly.
-        return (directory / stdout).read_text()
+        # Contents is a Path, so we read the file (once per session).
+        return read_test_file(directory / stdout)
     else:
         # Contents is a string, so we assume it's the content itself.
         return stdout
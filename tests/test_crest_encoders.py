@@ -46,6 +46,9 @@ def test_toml_dict():
     assert toml_dict["calculation"]["level"][0]["uhf"] == 1
     assert toml_dict["calculation"]["level"][0]["alpb"] == "acetonitrile"
 
+    # Does not modify the input keywords
+    assert inp_obj.keywords == {"calculation": {"level": [{"alpb": "acetonitrile"}]}}
+
     # Respects explicitly set threads and handles no "calculation" key
     inp_obj = ProgramInput(
         structure=weird_water,
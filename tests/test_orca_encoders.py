@@ -5,51 +5,39 @@ from qcdata.utils import water
 from qccodec.encoders.orca import _validate_keywords, encode
 from qccodec.exceptions import EncoderError
 
+# Shared across parametrized cases so each row does not build its own Model
+B3LYP = Model(method="b3lyp", basis="def2-svp")
+REVDSD = Model(method="revdsd-pbep86-d4/2021", basis="def2-svp")
+# Validated once; cases copy it with their own calctype, model and keywords
+PROTOTYPE = ProgramInput(calctype=CalcType.energy, model=B3LYP, structure=water)
+
 
 @pytest.mark.parametrize(
-    "calctype, method, basis, keywords",
+    "calctype, model, keywords",
     [
-        (CalcType.energy, "b3lyp", "def2-svp", {}),
-        (CalcType.energy, "b3lyp", "def2-svp", {"maxcore": 500, "pal": 4}),
-        (CalcType.energy, "b3lyp", "def2-svp", {"scf": {"convergence": "verytight"}}),
-        (
-            CalcType.energy,
-            "revdsd-pbep86-d4/2021",
-            "def2-svp",
-            {"basis": {"auxc": "def2-svp/c"}},
-        ),
-        (CalcType.gradient, "b3lyp", "def2-svp", {}),
+        (CalcType.energy, B3LYP, {}),
+        (CalcType.energy, B3LYP, {"maxcore": 500, "pal": 4}),
+        (CalcType.energy, B3LYP, {"scf": {"convergence": "verytight"}}),
+        (CalcType.energy, REVDSD, {"basis": {"auxc": "def2-svp/c"}}),
+        (CalcType.gradient, B3LYP, {}),
+        (CalcType.gradient, REVDSD, {"basis": {"auxc": "def2-svp/c"}, "numgrad": True}),
         (
             CalcType.gradient,
-            "revdsd-pbep86-d4/2021",
-            "def2-svp",
-            {"basis": {"auxc": "def2-svp/c"}, "numgrad": True},
-        ),
-        (
-            CalcType.gradient,
-            "revdsd-pbep86-d4/2021",
-            "def2-svp",
+            REVDSD,
             {"basis": {"auxc": "def2-svp/c"}, "numgrad": {"accuracy": 6, "dx": 0.002}},
         ),
-        (CalcType.hessian, "b3lyp", "def2-svp", {}),
+        (CalcType.hessian, B3LYP, {}),
         (
             CalcType.hessian,
-            "revdsd-pbep86-d4/2021",
-            "def2-svp",
+            REVDSD,
             {"basis": {"auxc": "def2-svp/c"}, "freq": {"numfreq": True}},
         ),
-        (CalcType.optimization, "b3lyp", "def2-svp", {"geom": {"maxiter": 30}}),
-        (
-            CalcType.optimization,
-            "b3lyp",
-            "def2-svp",
-            {"geom": {"maxiter": 30}, "numgrad": True},
-        ),
-        (CalcType.transition_state, "b3lyp", "def2-svp", {"geom": {"calc_hess": True}}),
+        (CalcType.optimization, B3LYP, {"geom": {"maxiter": 30}}),
+        (CalcType.optimization, B3LYP, {"geom": {"maxiter": 30}, "numgrad": True}),
+        (CalcType.transition_state, B3LYP, {"geom": {"calc_hess": True}}),
         (
             CalcType.transition_state,
-            "revdsd-pbep86-d4/2021",
-            "def2-svp",
+            REVDSD,
             {
                 "basis": {"auxc": "def2-svp/c"},
                 "geom": {"calc_hess": True, "numhess": True},
@@ -58,14 +46,11 @@ from qccodec.exceptions import EncoderError
     ],
 )
 def test_write_input_files(
-    calctype: CalcType, method: str, basis: str, keywords: dict[str, object]
+    calctype: CalcType, model: Model, keywords: dict[str, object]
 ):
     """Test write_input_files method."""
-    program_input = ProgramInput(
-        calctype=calctype,
-        model=Model(method=method, basis=basis),
-        structure=water,
-        keywords=keywords,
+    program_input = PROTOTYPE.model_copy(
+        update={"calctype": calctype, "model": model, "keywords": keywords}
     )
     native_input = encode(program_input)
     input_file = native_input.input_file
@@ -81,30 +66,43 @@ def test_write_input_files(
                 )
 
 
-def test_validate_keywords_raises_error_if_coords_block_in_keywords():
-    """The 'coords' block should not be set directly as a keyword."""
-
-    keywords = {"coords": {"units": "angstrom"}}
-    with pytest.raises(EncoderError):
-        _validate_keywords(keywords)
-
-
-def test_validate_keywords_raises_error_if_method_block_contains_method_keyword():
-    """The 'method' keyword should not be set inside the 'method' block."""
-    keywords = {"method": {"method": "b3lyp"}}
-    with pytest.raises(EncoderError):
-        _validate_keywords(keywords)
-
-
-def test_validate_keywords_raises_error_if_method_block_contains_runtyp_keyword():
-    """The 'runtyp' keyword should not be set inside the 'method' block."""
-    keywords = {"method": {"runtyp": "sp"}}
-    with pytest.raises(EncoderError):
-        _validate_keywords(keywords)
+@pytest.mark.parametrize(
+    "numgrad, expected",
+    [
+        (True, True),
+        ("true", True),
+        ("True", True),
+        ({}, True),
+        ({"accuracy": 6}, True),
+        (False, False),
+        ("false", False),
+        ("FALSE", False),
+    ],
+)
+def test_numgrad_only_written_when_requested(numgrad: object, expected: bool):
+    """A false or "false" numgrad value should not request a numerical gradient."""
+    program_input = PROTOTYPE.model_copy(
+        update={"calctype": CalcType.gradient, "keywords": {"numgrad": numgrad}}
+    )
+    input_file = encode(program_input).input_file
+    assert ("! numgrad" in input_file) is expected
 
 
-def test_validate_keywords_raises_error_if_basis_block_contains_basis_keyword():
-    """The 'basis' keyword should not be set inside the 'basis' block."""
-    keywords = {"basis": {"basis": "def2-svp"}}
+@pytest.mark.parametrize(
+    "keywords",
+    [
+        # The 'coords' block should not be set directly as a keyword.
+        {"coords": {"units": "angstrom"}},
+        # The 'method' keyword should not be set inside the 'method' block.
+        {"method": {"method": "b3lyp"}},
+        # The 'runtyp' keyword should not be set inside the 'method' block.
+        {"method": {"runtyp": "sp"}},
+        # The 'basis' keyword should not be set inside the 'basis' block.
+        {"basis": {"basis": "def2-svp"}},
+    ],
+    ids=["coords-block", "method-in-method", "runtyp-in-method", "basis-in-basis"],
+)
+def test_validate_keywords_raises_error_for_structured_data(keywords: dict):
+    """Keywords that belong on structured qcdata fields should raise an error."""
     with pytest.raises(EncoderError):
         _validate_keywords(keywords)
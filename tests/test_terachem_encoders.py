@@ -1,8 +1,10 @@
 import pytest
 
-from qccodec.encoders.terachem import PADDING, XYZ_FILENAME, encode
+from qccodec.encoders.terachem import encode
 from qccodec.exceptions import EncoderError
 
+from .conftest import expected_tcin
+
 
 def test_write_input_files(prog_input_factory):
     """Test write_input_files method."""
@@ -15,19 +17,9 @@ def test_write_input_files(prog_input_factory):
     # 2. Structure
     # 3. Model
     # 4. Keywords (test booleans to lower case, ints, sts, floats)
-
-    correct_tcin = (
-        f"{'run':<{PADDING}} {prog_input_factory.calctype.value}\n"
-        f"{'coordinates':<{PADDING}} {XYZ_FILENAME}\n"
-        f"{'charge':<{PADDING}} {prog_input_factory.structure.charge}\n"
-        f"{'spinmult':<{PADDING}} {prog_input_factory.structure.multiplicity}\n"
-        f"{'method':<{PADDING}} {prog_input_factory.model.method}\n"
-        f"{'basis':<{PADDING}} {prog_input_factory.model.basis}\n"
-        f"{'purify':<{PADDING}} {prog_input_factory.keywords['purify']}\n"
-        f"{'some-bool':<{PADDING}} "
-        f"{str(prog_input_factory.keywords['some-bool']).lower()}\n"
+    assert native_input.input_file == expected_tcin(
+        prog_input_factory, {"purify": "no", "some-bool": "false"}
     )
-    assert native_input.input_file == correct_tcin
 
 
 def test_write_input_files_renames_hessian_to_frequencies(prog_input_factory):
@@ -37,16 +29,8 @@ def test_write_input_files_renames_hessian_to_frequencies(prog_input_factory):
     prog_input_factory.keywords.update({"purify": "no", "some-bool": False})
     native_input = encode(prog_input_factory)
 
-    assert native_input.input_file == (
-        f"{'run':<{PADDING}} frequencies\n"
-        f"{'coordinates':<{PADDING}} {XYZ_FILENAME}\n"
-        f"{'charge':<{PADDING}} {prog_input_factory.structure.charge}\n"
-        f"{'spinmult':<{PADDING}} {prog_input_factory.structure.multiplicity}\n"
-        f"{'method':<{PADDING}} {prog_input_factory.model.method}\n"
-        f"{'basis':<{PADDING}} {prog_input_factory.model.basis}\n"
-        f"{'purify':<{PADDING}} {prog_input_factory.keywords['purify']}\n"
-        f"{'some-bool':<{PADDING}} "
-        f"{str(prog_input_factory.keywords['some-bool']).lower()}\n"
+    assert native_input.input_file == expected_tcin(
+        prog_input_factory, {"purify": "no", "some-bool": "false"}, run="frequencies"
     )
 
 
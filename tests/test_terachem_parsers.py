@@ -3,7 +3,7 @@ from pathlib import Path
 import pytest
 from qcdata import CalcType, ProgramOutput
 
-from qccodec.exceptions import MatchNotFoundError
+from qccodec.exceptions import MatchNotFoundError, ParserError
 from qccodec.parsers.terachem import (
     calculation_succeeded,
     parse_calctype,
@@ -146,6 +146,13 @@ test_cases = [
         success=True,
         answer=hessians.caffeine,
     ),
+    ParserTestCase(
+        name="Parse hessian no hessian",
+        parser=parse_hessian,
+        stdout=Path("water.gradient.out"),
+        calctype=CalcType.hessian,
+        success=False,
+    ),
     ParserTestCase(
         name="Parse number of atoms water",
         parser=parse_natoms,
@@ -279,6 +286,32 @@ def test_parse_git_commit(terachem_file):
     )
 
 
+@pytest.mark.filterwarnings("error")
+def test_parse_hessian_stops_at_next_section(terachem_file):
+    """
+    Tests that a following line starting with whitespace, a digit or 'E' is not
+    consumed as part of the Hessian block.
+    """
+    contents = terachem_file("water.frequencies.out")
+    end = contents.index("\n\n\nDipole moment derivatives")
+    contents = f"{contents[: end + 1]} E-field 1.0e-03\n{contents[end + 1 :]}"
+
+    assert parse_hessian(contents) == hessians.water
+
+
+@pytest.mark.filterwarnings("error")
+def test_parse_gradient_raises_parser_error_on_partial_row():
+    contents = (
+        "                dE/dX            dE/dY            dE/dZ\n"
+        "   -0.0000000000     0.0000000000     0.0141601628\n"
+        "    0.0000000000     0.0134664212\n"
+        "---------------------------------------------------\n"
+        "Net gradient: -3.579281e-09 -2.489212e-09  1.882070e-09\n"
+    )
+    with pytest.raises(ParserError):
+        parse_gradient(contents)
+
+
 def test_parse_excited_states_raises_exception_no_excited_states(terachem_file):
     """
     Tests the parse_excited_states function to ensure that it correctly raises